@@ -3,5 +3,6 @@
 from .researcher import research_node
 from .writer import writer_node
 from .critic import critic_node
+from .pipelined import pipelined_research_node
 
-__all__ = ["research_node", "writer_node", "critic_node"]
+__all__ = ["research_node", "writer_node", "critic_node", "pipelined_research_node"]
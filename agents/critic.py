@@ -8,6 +8,7 @@ publication or needs revision.
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, SystemMessage
 import json
+import time
 
 from graph.state import AgentState
 
@@ -19,8 +20,10 @@ def critic_node(state: AgentState) -> dict:
         state: Current agent state with draft_content
         
     Returns:
-        Updated state with critique_feedback, quality_status, and revision_count
+        Updated state with critique_feedback, critique_scores, quality_status,
+        and revision_count
     """
+    started = time.perf_counter()
     topic = state["topic"]
     draft_content = state["draft_content"]
     research_data = state["research_data"]
@@ -91,6 +94,8 @@ Please provide your critique.""")
         critique_data = json.loads(json_str.strip())
         quality_status = critique_data.get("decision", "Revision Needed")
         average_score = critique_data.get("average_score", 0)
+        scores = critique_data.get("scores", {})
+        critique_scores = {**(scores if isinstance(scores, dict) else {}), "average": average_score}
         
         # Format feedback for writer
         improvements = critique_data.get("improvements", [])
@@ -110,6 +115,7 @@ Please provide your critique.""")
         # Fallback if JSON parsing fails
         quality_status = "Acceptable" if revision_count >= 2 else "Revision Needed"
         average_score = 7.0 if quality_status == "Acceptable" else 6.0
+        critique_scores = {"average": average_score}
         feedback = critique_text
     
     # Increment revision count
@@ -129,7 +135,9 @@ Please provide your critique.""")
     
     return {
         "critique_feedback": feedback,
+        "critique_scores": critique_scores,
         "quality_status": quality_status,
         "revision_count": new_revision_count,
+        "timings": {"critic": time.perf_counter() - started},
         "messages": [status_msg]
     }
@@ -0,0 +1,163 @@
+"""Pipelined Research-Writer Agent - Overlaps synthesis with drafting.
+
+Instead of waiting for the full research synthesis, this node streams
+the synthesis and hands the first completed sections (Key Facts and
+Main Themes) to the writer, which starts drafting in the background.
+Once the synthesis finishes, the writer appends only the remaining
+sections and the conclusion, keeping the post-synthesis work short.
+"""
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from graph.state import AgentState
+from agents.researcher import SYNTHESIS_SECTIONS, search_topic, build_synthesis_prompt
+from agents.writer import build_draft_prompt
+
+# Number of leading sections the writer waits for before drafting
+EARLY_SECTIONS = 2
+
+
+def early_notes(text: str) -> str | None:
+    """Return the first EARLY_SECTIONS sections once they are complete.
+
+    A section is complete when the heading of the following section has
+    appeared in the streamed synthesis.
+
+    Args:
+        text: Synthesis text streamed so far
+
+    Returns:
+        The completed leading sections, or None if they are not done yet
+    """
+    heading, _ = SYNTHESIS_SECTIONS[EARLY_SECTIONS]
+    next_heading = re.search(
+        rf"^[#*\s\d.]*{re.escape(heading)}",
+        text,
+        re.MULTILINE
+    )
+    if next_heading is None:
+        return None
+    return text[:next_heading.start()].strip()
+
+
+def build_early_draft_prompt(topic: str, partial_notes: str) -> list:
+    """Build the prompt for drafting from the first research sections."""
+    return [
+        SystemMessage(content="""You are an expert blog writer known for creating engaging, 
+informative, and well-structured content. You are starting a blog post while the
+research notes are still being compiled; you have been given the first sections only.
+
+Write the opening of the post:
+1. A catchy, SEO-friendly title
+2. A hook that grabs attention
+3. Subheaded body sections covering the facts and themes in these notes
+4. Approximately 500-700 words
+
+Stop after the last body section. The rest of the post will be appended once the
+remaining notes arrive, so do not conclude or summarize.
+
+Format the output in Markdown."""),
+        HumanMessage(content=f"Topic: {topic}\n\nResearch Notes (partial):\n{partial_notes}")
+    ]
+
+
+def build_continuation_prompt(topic: str, remaining_notes: str, early_draft: str) -> list:
+    """Build the prompt that writes only the rest of an early draft."""
+    return [
+        SystemMessage(content="""You are an expert blog writer finishing a post you started
+from partial research notes. Continue it using the remaining notes.
+
+Write ONLY the new content that follows the draft so far:
+1. Subheaded sections covering the expert opinions and recent developments
+2. A thought-provoking conclusion or call-to-action
+3. Approximately 300-500 words, matching the tone and Markdown style of the draft
+
+Do not repeat the title or any part of the draft so far."""),
+        HumanMessage(content=f"""Topic: {topic}
+
+Draft So Far:
+{early_draft}
+
+Remaining Research Notes:
+{remaining_notes}""")
+    ]
+
+
+def pipelined_research_node(state: AgentState) -> dict:
+    """Execute research and the initial draft as overlapping phases.
+
+    The writer is charged from the moment the early draft is submitted,
+    so its timing includes the drafting that overlaps the synthesis.
+
+    Args:
+        state: Current agent state containing the topic
+
+    Returns:
+        Updated state with research_data, draft_content and status messages
+    """
+    started = time.perf_counter()
+    topic = state["topic"]
+
+    # Initialize Gemini LLMs for synthesis and writing
+    research_llm = ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        temperature=0.3
+    )
+    writer_llm = ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        temperature=0.7  # Higher creativity for writing
+    )
+
+    search_results, raw_research = search_topic(topic)
+
+    # Stream the synthesis, starting the writer once the early sections land
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        early_draft = None
+        partial_notes = ""
+        research_data = ""
+        for chunk in research_llm.stream(build_synthesis_prompt(topic, raw_research)):
+            research_data += chunk.content
+            if early_draft is None:
+                partial_notes = early_notes(research_data)
+                if partial_notes:
+                    writer_started = time.perf_counter()
+                    early_draft = executor.submit(
+                        writer_llm.invoke,
+                        build_early_draft_prompt(topic, partial_notes)
+                    )
+        research_done = time.perf_counter()
+
+        # Only the remaining sections are written after the synthesis
+        if early_draft is not None:
+            opening = early_draft.result().content
+            notes_end = research_data.find(partial_notes) + len(partial_notes)
+            remaining_notes = research_data[notes_end:].strip()
+            continuation = writer_llm.invoke(
+                build_continuation_prompt(topic, remaining_notes, opening)
+            ).content
+            draft_content = f"{opening.rstrip()}\n\n{continuation.strip()}"
+            action = "Drafted alongside research and completed initial draft"
+        else:
+            # Synthesis never produced the expected headings; draft normally
+            writer_started = research_done
+            draft_content = writer_llm.invoke(build_draft_prompt(topic, research_data)).content
+            action = "Created initial draft"
+
+    finished = time.perf_counter()
+
+    return {
+        "research_data": research_data,
+        "draft_content": draft_content,
+        "timings": {
+            "researcher": research_done - started,
+            "writer": finished - writer_started,
+        },
+        "messages": [
+            f"🔍 **Researcher Agent**: Completed research on '{topic}'. Found {len(search_results)} sources and synthesized key insights.",
+            f"✍️ **Writer Agent**: {action} for '{topic}'."
+        ]
+    }
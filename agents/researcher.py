@@ -5,7 +5,7 @@ Tavily's search API, and synthesizes the findings into structured
 research data for the writer agent.
 """
 
-import os
+import time
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -13,17 +13,36 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from graph.state import AgentState
 
 
-def research_node(state: AgentState) -> dict:
-    """Execute research phase using Tavily Search.
+# Section headings of the research notes, in order, with what each covers
+SYNTHESIS_SECTIONS = [
+    ("Key Facts & Statistics", "Important data points"),
+    ("Main Themes", "Core concepts and ideas"),
+    ("Expert Opinions", "Notable quotes or perspectives"),
+    ("Recent Developments", "Latest news or updates"),
+    ("Sources", "List the URLs for citation"),
+]
+
+SYNTHESIS_SYSTEM_PROMPT = """You are a research analyst. Synthesize the given search results 
+into well-organized research notes that will help a writer create an engaging blog post.
+
+Structure your output as:
+""" + "\n".join(
+    f"{i}. **{heading}** - {description}"
+    for i, (heading, description) in enumerate(SYNTHESIS_SECTIONS, 1)
+) + """
+
+Be thorough but concise. Focus on actionable insights for the writer."""
+
+
+def search_topic(topic: str) -> tuple[list[dict], str]:
+    """Run the Tavily search for a topic and format the results.
     
     Args:
-        state: Current agent state containing the topic
+        topic: The research topic to search for
         
     Returns:
-        Updated state with research_data and status message
+        Tuple of (raw search results, formatted results for the synthesis prompt)
     """
-    topic = state["topic"]
-    
     # Initialize Tavily search tool
     tavily_tool = TavilySearchResults(
         max_results=5,
@@ -31,12 +50,6 @@ def research_node(state: AgentState) -> dict:
         include_raw_content=False
     )
     
-    # Initialize Gemini LLM for synthesis
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-2.5-flash",
-        temperature=0.3
-    )
-    
     # Perform search
     search_results = tavily_tool.invoke({"query": topic})
     
@@ -48,28 +61,43 @@ def research_node(state: AgentState) -> dict:
             f"**Content:** {result.get('content', 'No content available')}\n"
         )
     
-    raw_research = "\n---\n".join(formatted_results)
-    
-    # Synthesize research into structured notes
-    synthesis_prompt = [
-        SystemMessage(content="""You are a research analyst. Synthesize the given search results 
-into well-organized research notes that will help a writer create an engaging blog post.
+    return search_results, "\n---\n".join(formatted_results)
 
-Structure your output as:
-1. **Key Facts & Statistics** - Important data points
-2. **Main Themes** - Core concepts and ideas
-3. **Expert Opinions** - Notable quotes or perspectives
-4. **Recent Developments** - Latest news or updates
-5. **Sources** - List the URLs for citation
 
-Be thorough but concise. Focus on actionable insights for the writer."""),
+def build_synthesis_prompt(topic: str, raw_research: str) -> list:
+    """Build the prompt that turns raw search results into research notes."""
+    return [
+        SystemMessage(content=SYNTHESIS_SYSTEM_PROMPT),
         HumanMessage(content=f"Topic: {topic}\n\nSearch Results:\n{raw_research}")
     ]
+
+
+def research_node(state: AgentState) -> dict:
+    """Execute research phase using Tavily Search.
     
-    synthesis_response = llm.invoke(synthesis_prompt)
+    Args:
+        state: Current agent state containing the topic
+        
+    Returns:
+        Updated state with research_data and status message
+    """
+    started = time.perf_counter()
+    topic = state["topic"]
+    
+    # Initialize Gemini LLM for synthesis
+    llm = ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        temperature=0.3
+    )
+    
+    search_results, raw_research = search_topic(topic)
+    
+    # Synthesize research into structured notes
+    synthesis_response = llm.invoke(build_synthesis_prompt(topic, raw_research))
     research_data = synthesis_response.content
     
     return {
         "research_data": research_data,
+        "timings": {"researcher": time.perf_counter() - started},
         "messages": [f"🔍 **Researcher Agent**: Completed research on '{topic}'. Found {len(search_results)} sources and synthesized key insights."]
     }
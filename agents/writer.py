@@ -5,12 +5,36 @@ blog post. On revision cycles, it incorporates critique feedback to
 improve the draft.
 """
 
+import time
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from graph.state import AgentState
 
 
+DRAFT_SYSTEM_PROMPT = """You are an expert blog writer known for creating engaging, 
+informative, and well-structured content. Write a compelling blog post based on the research provided.
+
+Your blog post should:
+1. Have a catchy, SEO-friendly title
+2. Start with a hook that grabs attention
+3. Use clear subheadings to organize content
+4. Include relevant facts and statistics from the research
+5. Maintain a conversational yet authoritative tone
+6. End with a thought-provoking conclusion or call-to-action
+7. Be approximately 800-1200 words
+
+Format the output in Markdown."""
+
+
+def build_draft_prompt(topic: str, research_data: str) -> list:
+    """Build the prompt for an initial draft from research notes."""
+    return [
+        SystemMessage(content=DRAFT_SYSTEM_PROMPT),
+        HumanMessage(content=f"Topic: {topic}\n\nResearch Notes:\n{research_data}")
+    ]
+
+
 def writer_node(state: AgentState) -> dict:
     """Execute writing phase to create or revise blog post.
     
@@ -20,6 +44,7 @@ def writer_node(state: AgentState) -> dict:
     Returns:
         Updated state with draft_content and status message
     """
+    started = time.perf_counter()
     topic = state["topic"]
     research_data = state["research_data"]
     critique_feedback = state.get("critique_feedback", "")
@@ -34,22 +59,7 @@ def writer_node(state: AgentState) -> dict:
     # Determine if this is initial draft or revision
     if revision_count == 0 or not critique_feedback:
         # Initial draft
-        writing_prompt = [
-            SystemMessage(content="""You are an expert blog writer known for creating engaging, 
-informative, and well-structured content. Write a compelling blog post based on the research provided.
-
-Your blog post should:
-1. Have a catchy, SEO-friendly title
-2. Start with a hook that grabs attention
-3. Use clear subheadings to organize content
-4. Include relevant facts and statistics from the research
-5. Maintain a conversational yet authoritative tone
-6. End with a thought-provoking conclusion or call-to-action
-7. Be approximately 800-1200 words
-
-Format the output in Markdown."""),
-            HumanMessage(content=f"Topic: {topic}\n\nResearch Notes:\n{research_data}")
-        ]
+        writing_prompt = build_draft_prompt(topic, research_data)
         action = "Created initial draft"
     else:
         # Revision based on feedback
@@ -79,5 +89,6 @@ Please revise the blog post to address this feedback.""")
     
     return {
         "draft_content": draft_content,
+        "timings": {"writer": time.perf_counter() - started},
         "messages": [f"✍️ **Writer Agent**: {action} for '{topic}'."]
     }
@@ -6,7 +6,13 @@ as it researches, writes, critiques, and refines blog posts.
 
 import streamlit as st
 from dotenv import load_dotenv
+from datetime import datetime
 import os
+import re
+import sqlite3
+import time
+
+from storage.run_store import RunStore
 
 # Load environment variables
 load_dotenv()
@@ -93,6 +99,29 @@ with col2:
     st.write("")  # Spacer
     start_button = st.button("🚀 Start Research", type="primary", use_container_width=True)
 
+pipelined = st.checkbox(
+    "⚡ Pipelined mode - start drafting while research is still being synthesized",
+    value=False
+)
+regenerate = st.checkbox(
+    "🔁 Regenerate - rerun the pipeline even if a recent post exists for this topic",
+    value=False
+)
+
+
+@st.cache_resource
+def get_run_store() -> RunStore:
+    """Open the run history store once per server process."""
+    return RunStore()
+
+
+try:
+    run_store = get_run_store()
+except sqlite3.Error as e:
+    # History is optional; the pipeline still runs without it
+    run_store = None
+    st.warning(f"Run history is unavailable: {str(e)}")
+
 # Initialize session state
 if "workflow_complete" not in st.session_state:
     st.session_state.workflow_complete = False
@@ -100,16 +129,50 @@ if "final_draft" not in st.session_state:
     st.session_state.final_draft = ""
 if "messages" not in st.session_state:
     st.session_state.messages = []
+if "final_topic" not in st.session_state:
+    st.session_state.final_topic = ""
+if "served_run" not in st.session_state:
+    st.session_state.served_run = None
+
+
+def show_run(run: dict) -> None:
+    """Display a stored run as the final output."""
+    st.session_state.workflow_complete = True
+    st.session_state.final_draft = run["final_draft"]
+    st.session_state.final_topic = run["topic"]
+    st.session_state.served_run = run
+
+
+def plain_snippet(text: str) -> str:
+    """Strip Markdown from a draft excerpt for compact display."""
+    text = re.sub(r"^\s*#+\s*", "", text, flags=re.MULTILINE)
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    text = re.sub(r"[*_`>\[\]]", "", text)
+    return " ".join(text.split())
+
+
+# Serve a recent run for the same topic from history
+cached_run = None
+if start_button and topic and not regenerate and run_store:
+    try:
+        cached_run = run_store.lookup(topic)
+    except sqlite3.Error as e:
+        st.warning(f"Could not check run history: {str(e)}")
+if cached_run:
+    show_run(cached_run)
 
 # Run workflow
-if start_button and topic:
+elif start_button and topic:
     # Reset state
     st.session_state.workflow_complete = False
     st.session_state.final_draft = ""
+    st.session_state.final_topic = topic
+    st.session_state.served_run = None
     st.session_state.messages = []
     
     # Import workflow
-    from graph.workflow import create_workflow
+    from graph.state import add_timings
+    from graph.workflow import create_workflow, create_initial_state
     
     # Create containers for real-time updates
     progress_container = st.container()
@@ -118,18 +181,11 @@ if start_button and topic:
         st.subheader("🤖 Agent Activity")
         
         # Create the workflow
-        app = create_workflow()
+        topology = "pipelined" if pipelined else "sequential"
+        app = create_workflow(topology)
         
         # Initial state
-        initial_state = {
-            "topic": topic,
-            "research_data": "",
-            "draft_content": "",
-            "critique_feedback": "",
-            "revision_count": 0,
-            "quality_status": "",
-            "messages": []
-        }
+        initial_state = create_initial_state(topic)
         
         # Progress tracking
         progress_bar = st.progress(0)
@@ -138,7 +194,8 @@ if start_button and topic:
         
         # Run the workflow
         step_count = 0
-        final_state = {}
+        final_state = dict(initial_state)
+        started = time.perf_counter()
         
         try:
             for output in app.stream(initial_state):
@@ -148,7 +205,7 @@ if start_button and topic:
                     # Update progress
                     progress = min(step_count * 20, 95)  # Cap at 95% until complete
                     progress_bar.progress(progress)
-                    status_text.text(f"Currently running: {node_name.title()} Agent...")
+                    status_text.text(f"Currently running: {node_name.replace('_', ' & ').title()} Agent...")
                     
                     # Display messages
                     if "messages" in state_update:
@@ -166,7 +223,9 @@ if start_button and topic:
                                         st.warning(msg)
                     
                     # Store state updates
+                    timings = add_timings(final_state["timings"], state_update.get("timings", {}))
                     final_state.update(state_update)
+                    final_state["timings"] = timings
             
             # Complete
             progress_bar.progress(100)
@@ -177,12 +236,29 @@ if start_button and topic:
         except Exception as e:
             st.error(f"Error during execution: {str(e)}")
             st.exception(e)
+        
+        # Record the run so revisits are served from history
+        if st.session_state.workflow_complete and run_store:
+            try:
+                run_store.record_run(final_state, topology, time.perf_counter() - started)
+            except sqlite3.Error as e:
+                st.warning(f"Could not save this run to history: {str(e)}")
 
 # Display final output
 if st.session_state.workflow_complete and st.session_state.final_draft:
     st.divider()
     st.subheader("📝 Final Blog Post")
     
+    served_run = st.session_state.served_run
+    if served_run:
+        generated_at = datetime.fromtimestamp(served_run["created_at"]).strftime("%Y-%m-%d %H:%M")
+        st.info(
+            f"📚 Served from history (generated {generated_at}, "
+            f"score {served_run['critique_scores'].get('average', 'N/A')}/10, "
+            f"{served_run['revision_count']} critique rounds). "
+            "Tick **Regenerate** to rerun the pipeline."
+        )
+    
     # Create tabs for different views
     tab1, tab2 = st.tabs(["📖 Rendered", "📋 Markdown"])
     
@@ -196,12 +272,49 @@ if st.session_state.workflow_complete and st.session_state.final_draft:
     st.download_button(
         label="📥 Download Blog Post",
         data=st.session_state.final_draft,
-        file_name=f"blog_post_{topic.replace(' ', '_').lower()[:30]}.md",
+        file_name=f"blog_post_{st.session_state.final_topic.replace(' ', '_').lower()[:30]}.md",
         mime="text/markdown"
     )
 
 # Sidebar with info
+HISTORY_PAGE_SIZE = 5
+
 with st.sidebar:
+    st.header("🗂️ Run History")
+    if run_store is None:
+        st.caption("Run history is unavailable.")
+    else:
+        try:
+            history_query = st.text_input("Search past posts:", placeholder="e.g., quantum")
+            total_runs = run_store.count(history_query)
+            
+            if total_runs:
+                page_count = (total_runs + HISTORY_PAGE_SIZE - 1) // HISTORY_PAGE_SIZE
+                page = st.number_input(
+                    f"Page (of {page_count})", min_value=1, max_value=page_count, value=1
+                )
+                runs = run_store.search(
+                    history_query, limit=HISTORY_PAGE_SIZE, offset=(page - 1) * HISTORY_PAGE_SIZE
+                )
+                for run in runs:
+                    generated_at = datetime.fromtimestamp(run["created_at"]).strftime("%Y-%m-%d %H:%M")
+                    with st.expander(f"{run['topic']} · {generated_at}"):
+                        st.caption(
+                            f"Score {run['critique_scores'].get('average', 'N/A')}/10 · "
+                            f"{run['revision_count']} critique rounds · "
+                            f"{run['total_seconds']:.0f}s ({run['topology']})"
+                        )
+                        st.text(plain_snippet(run["snippet"]))
+                        if st.button("Open", key=f"open_run_{run['id']}"):
+                            show_run(run)
+                            st.rerun()
+            else:
+                st.caption("No past runs found.")
+        except sqlite3.Error as e:
+            st.warning(f"Could not load run history: {str(e)}")
+    
+    st.divider()
+    
     st.header("ℹ️ About")
     st.markdown("""
     This system uses **three AI agents** working together:
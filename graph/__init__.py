@@ -1,6 +1,6 @@
 """Graph module for the Agentic Research System."""
 
 from .state import AgentState
-from .workflow import create_workflow
+from .workflow import create_workflow, generate_post
 
-__all__ = ["AgentState", "create_workflow"]
+__all__ = ["AgentState", "create_workflow", "generate_post"]
@@ -8,6 +8,18 @@ from typing import TypedDict, Annotated
 from operator import add
 
 
+def add_timings(left: dict[str, float], right: dict[str, float]) -> dict[str, float]:
+    """Reducer that sums per-node elapsed seconds across the run.
+    
+    Nodes that execute more than once (the writer and critic during
+    revisions) accumulate their total time under a single key.
+    """
+    merged = dict(left or {})
+    for node, seconds in (right or {}).items():
+        merged[node] = merged.get(node, 0.0) + seconds
+    return merged
+
+
 class AgentState(TypedDict):
     """State object that persists across all nodes in the graph.
     
@@ -16,14 +28,18 @@ class AgentState(TypedDict):
         research_data: Synthesized research from Tavily search
         draft_content: Current blog post draft
         critique_feedback: Critic's assessment and suggestions
+        critique_scores: Critic's per-criterion scores plus "average"
         revision_count: Number of revision iterations (max 3)
         quality_status: "Acceptable" or "Revision Needed"
         messages: Log of agent thoughts for UI display
+        timings: Total seconds spent in each node, keyed by node name
     """
     topic: str
     research_data: str
     draft_content: str
     critique_feedback: str
+    critique_scores: dict[str, float]
     revision_count: int
     quality_status: str
     messages: Annotated[list[str], add]
+    timings: Annotated[dict[str, float], add_timings]
@@ -5,14 +5,25 @@ Research -> Writer -> Critic -> (Revision Loop or END)
 
 The conditional edge from Critic determines whether to loop back
 for revision or proceed to completion.
+
+A "pipelined" topology replaces the Research -> Writer edge with a
+single node that overlaps the research synthesis with the first draft.
 """
 
+import statistics
+import time
 from langgraph.graph import StateGraph, END, START
 
-from graph.state import AgentState
+from graph.state import AgentState, add_timings
 from agents.researcher import research_node
 from agents.writer import writer_node
 from agents.critic import critic_node
+from agents.pipelined import pipelined_research_node
+from storage.run_store import RunStore, DEFAULT_MAX_AGE_HOURS
+
+
+# Supported graph topologies for create_workflow()
+TOPOLOGIES = ("sequential", "pipelined")
 
 
 def route_critique(state: AgentState) -> str:
@@ -35,26 +46,40 @@ def route_critique(state: AgentState) -> str:
         return "writer"
 
 
-def create_workflow() -> StateGraph:
+def create_workflow(topology: str = "sequential") -> StateGraph:
     """Create and compile the LangGraph workflow.
     
+    Args:
+        topology: "sequential" runs research to completion before writing;
+            "pipelined" starts drafting while the synthesis is still streaming
+    
     Returns:
         Compiled StateGraph ready for execution
     """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology '{topology}'. Expected one of {TOPOLOGIES}.")
+    
     # Initialize the state graph with our state schema
     workflow = StateGraph(AgentState)
     
     # Add nodes - each node is an agent function
-    workflow.add_node("researcher", research_node)
     workflow.add_node("writer", writer_node)
     workflow.add_node("critic", critic_node)
     
-    # Add edges - define the flow between nodes
-    # START -> researcher: Begin with research
-    workflow.add_edge(START, "researcher")
-    
-    # researcher -> writer: Pass research to writer
-    workflow.add_edge("researcher", "writer")
+    if topology == "pipelined":
+        # START -> research_writer -> critic: Research and first draft overlap
+        workflow.add_node("research_writer", pipelined_research_node)
+        workflow.add_edge(START, "research_writer")
+        workflow.add_edge("research_writer", "critic")
+    else:
+        workflow.add_node("researcher", research_node)
+        
+        # Add edges - define the flow between nodes
+        # START -> researcher: Begin with research
+        workflow.add_edge(START, "researcher")
+        
+        # researcher -> writer: Pass research to writer
+        workflow.add_edge("researcher", "writer")
     
     # writer -> critic: Submit draft for review
     workflow.add_edge("writer", "critic")
@@ -74,45 +99,150 @@ def create_workflow() -> StateGraph:
     return workflow.compile()
 
 
-def run_workflow(topic: str):
-    """Execute the workflow for a given topic.
+def create_initial_state(topic: str) -> AgentState:
+    """Build the starting state for a workflow run.
     
     Args:
         topic: The research topic to process
         
-    Yields:
-        State updates as the workflow progresses
+    Returns:
+        AgentState with empty research, draft, and critique fields
     """
-    # Create the compiled workflow
-    app = create_workflow()
-    
-    # Initialize the starting state
-    initial_state = {
+    return {
         "topic": topic,
         "research_data": "",
         "draft_content": "",
         "critique_feedback": "",
+        "critique_scores": {},
         "revision_count": 0,
         "quality_status": "",
-        "messages": []
+        "messages": [],
+        "timings": {}
     }
+
+
+def run_workflow(topic: str, topology: str = "sequential"):
+    """Execute the workflow for a given topic.
+    
+    Args:
+        topic: The research topic to process
+        topology: Graph topology passed to create_workflow()
+        
+    Yields:
+        State updates as the workflow progresses
+    """
+    # Create the compiled workflow
+    app = create_workflow(topology)
     
     # Stream the execution
-    for output in app.stream(initial_state):
+    for output in app.stream(create_initial_state(topic)):
         yield output
 
 
+def generate_post(
+    topic: str,
+    topology: str = "sequential",
+    store: RunStore | None = None,
+    regenerate: bool = False,
+    max_age_hours: float = DEFAULT_MAX_AGE_HOURS
+) -> dict:
+    """Return a blog post for a topic, reusing a recent run when possible.
+    
+    Looks the topic up in the run store first; only on a miss (or when
+    regenerate is set) is the full workflow executed and recorded.
+    
+    Args:
+        topic: The research topic to process
+        topology: Graph topology passed to create_workflow()
+        store: Run history store; a default RunStore is opened if omitted
+        regenerate: Ignore stored runs and rerun the pipeline
+        max_age_hours: Oldest stored run that is still served
+        
+    Returns:
+        The stored run record, with "cached" set if it was served from history
+    """
+    store = store or RunStore()
+    
+    if not regenerate:
+        record = store.lookup(topic, max_age_hours)
+        if record is not None:
+            return {**record, "cached": True}
+    
+    started = time.perf_counter()
+    final_state = create_workflow(topology).invoke(create_initial_state(topic))
+    run_id = store.record_run(final_state, topology, time.perf_counter() - started)
+    return {**store.get(run_id), "cached": False}
+
+
+def measure_latency(topic: str, runs: int = 3) -> dict[str, dict]:
+    """Measure the time from START to the first critic call per topology.
+    
+    The critic and its revision loop are identical in both topologies
+    and depend on the critic's scores, so each run stops as soon as the
+    first draft is ready for review.
+    
+    Args:
+        topic: The research topic to process
+        runs: Number of runs per topology
+        
+    Returns:
+        Per topology name: median and mean seconds to the first draft, and
+        the median seconds spent in each node according to their timings
+    """
+    apps = {topology: create_workflow(topology) for topology in TOPOLOGIES}
+    latencies = {topology: [] for topology in TOPOLOGIES}
+    node_timings = {topology: [] for topology in TOPOLOGIES}
+    
+    # Alternate topologies each round so warm-up and rate-limit drift
+    # affect both equally
+    for _ in range(runs):
+        for topology, app in apps.items():
+            timings = {}
+            started = time.perf_counter()
+            for output in app.stream(create_initial_state(topic)):
+                state_update = next(iter(output.values()))
+                timings = add_timings(timings, state_update.get("timings", {}))
+                if state_update.get("draft_content"):
+                    break
+            latencies[topology].append(time.perf_counter() - started)
+            node_timings[topology].append(timings)
+    
+    return {
+        topology: {
+            "median": statistics.median(latencies[topology]),
+            "mean": statistics.mean(latencies[topology]),
+            "timings": {
+                node: statistics.median(t.get(node, 0.0) for t in node_timings[topology])
+                for node in node_timings[topology][0]
+            },
+        }
+        for topology in TOPOLOGIES
+    }
+
+
 # For testing
 if __name__ == "__main__":
-    import os
+    import sys
     from dotenv import load_dotenv
     
     load_dotenv()
     
     test_topic = "The Future of Renewable Energy"
-    print(f"Running workflow for topic: {test_topic}\n")
     
-    for step in run_workflow(test_topic):
+    if "--compare" in sys.argv:
+        print(f"Measuring time to first draft for topic: {test_topic}\n")
+        results = measure_latency(test_topic)
+        for topology, result in results.items():
+            nodes = ", ".join(f"{node} {seconds:.1f}s" for node, seconds in result["timings"].items())
+            print(f"{topology:>10}: median {result['median']:.1f}s, mean {result['mean']:.1f}s ({nodes})")
+        saved = results["sequential"]["median"] - results["pipelined"]["median"]
+        print(f"\nPipelined saved {saved:.1f}s (median) before the first critique")
+        sys.exit(0)
+    
+    topology = "pipelined" if "--pipelined" in sys.argv else "sequential"
+    print(f"Running {topology} workflow for topic: {test_topic}\n")
+    
+    for step in run_workflow(test_topic, topology):
         for node_name, state_update in step.items():
             print(f"[{node_name}] completed")
             if "messages" in state_update:
@@ -0,0 +1,5 @@
+"""Storage module for the Agentic Research System."""
+
+from .run_store import RunStore
+
+__all__ = ["RunStore"]
@@ -0,0 +1,193 @@
+"""Run Store - Persistent, searchable history of completed workflow runs.
+
+Each completed run is recorded in SQLite with its topic, final draft,
+critique scores, revision count and per-node timings. An FTS5 index
+over topic and draft supports full-text search, and recent runs for
+the same topic can be served without rerunning the pipeline.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+
+
+# Database location when neither a path nor RUN_STORE_PATH is given
+DEFAULT_DB_PATH = "runs.db"
+
+# How long a stored run is served for the same topic before regenerating
+DEFAULT_MAX_AGE_HOURS = 24.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL,
+    topic_key TEXT NOT NULL,
+    topology TEXT NOT NULL,
+    final_draft TEXT NOT NULL,
+    critique_scores TEXT NOT NULL,
+    revision_count INTEGER NOT NULL,
+    timings TEXT NOT NULL,
+    total_seconds REAL NOT NULL,
+    created_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS runs_topic_key ON runs (topic_key, created_at);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS runs_fts USING fts5(
+    topic, final_draft, content='runs', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS runs_ai AFTER INSERT ON runs BEGIN
+    INSERT INTO runs_fts (rowid, topic, final_draft)
+    VALUES (new.id, new.topic, new.final_draft);
+END;
+
+CREATE TRIGGER IF NOT EXISTS runs_ad AFTER DELETE ON runs BEGIN
+    INSERT INTO runs_fts (runs_fts, rowid, topic, final_draft)
+    VALUES ('delete', old.id, old.topic, old.final_draft);
+END;
+"""
+
+
+def normalize_topic(topic: str) -> str:
+    """Normalize a topic so trivially different spellings share history."""
+    return " ".join(topic.lower().split())
+
+
+def fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query that matches all of its words.
+
+    Each word is quoted so punctuation typed by the user cannot be
+    interpreted as FTS5 query syntax.
+    """
+    words = re.findall(r"\w+", query)
+    return " ".join(f'"{word}"' for word in words)
+
+
+class RunStore:
+    """SQLite-backed history of completed runs.
+
+    A new connection is opened per call so the store can be shared
+    between Streamlit reruns and worker threads.
+
+    Attributes:
+        path: Location of the SQLite database file
+    """
+
+    def __init__(self, path: str | None = None):
+        # Resolved at construction so a RUN_STORE_PATH loaded from .env applies
+        self.path = path or os.getenv("RUN_STORE_PATH", DEFAULT_DB_PATH)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> dict:
+        record = dict(row)
+        record["critique_scores"] = json.loads(record["critique_scores"])
+        record["timings"] = json.loads(record["timings"])
+        return record
+
+    def record_run(self, final_state: dict, topology: str, total_seconds: float) -> int:
+        """Store a completed run.
+
+        Args:
+            final_state: Final AgentState of the workflow
+            topology: Graph topology the run used
+            total_seconds: End-to-end wall-clock time of the run
+
+        Returns:
+            The id of the stored run
+        """
+        topic = final_state["topic"]
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                """INSERT INTO runs (topic, topic_key, topology, final_draft, critique_scores,
+                                     revision_count, timings, total_seconds, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    topic,
+                    normalize_topic(topic),
+                    topology,
+                    final_state.get("draft_content", ""),
+                    json.dumps(final_state.get("critique_scores", {})),
+                    final_state.get("revision_count", 0),
+                    json.dumps(final_state.get("timings", {})),
+                    total_seconds,
+                    time.time(),
+                )
+            )
+            return cursor.lastrowid
+
+    def get(self, run_id: int) -> dict | None:
+        """Fetch a single run by id, or None if it does not exist."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return self._to_record(row) if row else None
+
+    def lookup(self, topic: str, max_age_hours: float = DEFAULT_MAX_AGE_HOURS) -> dict | None:
+        """Return the most recent run for a topic if it is fresh enough.
+
+        Args:
+            topic: Research topic; case and whitespace are ignored
+            max_age_hours: Oldest run that is still served
+
+        Returns:
+            The stored run, or None if there is no recent run for the topic
+        """
+        cutoff = time.time() - max_age_hours * 3600
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                """SELECT * FROM runs WHERE topic_key = ? AND created_at >= ?
+                   ORDER BY created_at DESC LIMIT 1""",
+                (normalize_topic(topic), cutoff)
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    def search(self, query: str = "", limit: int = 10, offset: int = 0) -> list[dict]:
+        """List runs, newest first, or full-text search them by relevance.
+
+        Args:
+            query: Words to match in the topic or draft; empty lists all runs
+            limit: Page size
+            offset: Number of runs to skip
+
+        Returns:
+            Stored runs, each with a plain "snippet" of the matching draft text
+        """
+        match = fts_query(query)
+        with closing(self._connect()) as conn:
+            if match:
+                rows = conn.execute(
+                    """SELECT runs.*, snippet(runs_fts, 1, '', '', '…', 24) AS snippet
+                       FROM runs_fts JOIN runs ON runs.id = runs_fts.rowid
+                       WHERE runs_fts MATCH ?
+                       ORDER BY bm25(runs_fts) LIMIT ? OFFSET ?""",
+                    (match, limit, offset)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    """SELECT *, substr(final_draft, 1, 160) AS snippet
+                       FROM runs ORDER BY created_at DESC LIMIT ? OFFSET ?""",
+                    (limit, offset)
+                ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def count(self, query: str = "") -> int:
+        """Count the runs that search() would return across all pages."""
+        match = fts_query(query)
+        with closing(self._connect()) as conn:
+            if match:
+                row = conn.execute(
+                    "SELECT COUNT(*) FROM runs_fts WHERE runs_fts MATCH ?", (match,)
+                ).fetchone()
+            else:
+                row = conn.execute("SELECT COUNT(*) FROM runs").fetchone()
+        return row[0]